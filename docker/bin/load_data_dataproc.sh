@@ -34,6 +34,7 @@ hailctl dataproc start \
     --max-idle 30m \
     --num-workers 2 \
     --num-preemptible-workers 12 \
+    --properties "spark:spark.hadoop.io.file.buffer.size=1048576" \
     seqr-loading-cluster
 
 # submit annotation job to dataproc cluster
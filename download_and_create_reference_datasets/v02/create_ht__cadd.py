@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from kubernetes.shell_utils import simple_run as run
+from gcloud_dataproc.v02 import run_script
 
-run((
-    "python3 gcloud_dataproc/v02/run_script.py "
-    "--cluster create-ht-cadd "
-    "download_and_create_reference_datasets/v02/hail_scripts/write_cadd_ht.py"))
+run_script.main([
+    "--cluster", "create-ht-cadd",
+    "download_and_create_reference_datasets/v02/hail_scripts/write_cadd_ht.py",
+])
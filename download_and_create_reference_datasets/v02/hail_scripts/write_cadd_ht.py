@@ -2,7 +2,9 @@
 
 # combine the pre-computed CADD .tsvs from https://cadd.gs.washington.edu/download into 1 Table for each genome build
 
+import argparse
 import logging
+import os
 logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s')
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -28,22 +30,31 @@ def import_cadd_table(path: str, genome_version: str) -> hl.Table:
     alleles = hl.array([cadd_ht.ref, cadd_ht.alt])
     cadd_ht = cadd_ht.transmute(locus=locus, alleles=alleles)
 
-    cadd_union_ht = cadd_ht.head(0)
-    for contigs in (range(1, 10), list(range(10, 23)) + ["X", "Y", "MT"]):
-        contigs = ["chr%s" % contig for contig in contigs] if genome_version == "38" else contigs
-        cadd_ht_subset = cadd_ht.filter(hl.array(list(map(str, contigs))).contains(cadd_ht.locus.contig))
-        cadd_union_ht = cadd_union_ht.union(cadd_ht_subset)
+    # Filter to the standard contigs in a single pass rather than unioning per-contig subsets,
+    # which scans the source tsv once per subset.
+    contigs = list(range(1, 23)) + ["X", "Y", "MT"]
+    contigs = ["chr%s" % contig for contig in contigs] if genome_version == "38" else contigs
+    cadd_ht = cadd_ht.filter(hl.literal(set(map(str, contigs))).contains(cadd_ht.locus.contig))
 
-    cadd_union_ht = cadd_union_ht.key_by("locus", "alleles")
+    cadd_ht = cadd_ht.key_by("locus", "alleles")
 
-    cadd_union_ht.describe()
+    cadd_ht.describe()
 
-    return cadd_union_ht
+    return cadd_ht
+
+p = argparse.ArgumentParser()
+p.add_argument("--force", help="Rewrite tables that have already been written successfully", action="store_true")
+args = p.parse_args()
 
 for genome_version in ["37", "38"]:
+    output_path = f"gs://seqr-reference-data/GRCh{genome_version}/CADD/CADD_snvs_and_indels.v1.6.ht"
+    if not args.force and hl.hadoop_exists(os.path.join(output_path, "_SUCCESS")):
+        logger.info(f"Skipping {output_path}, it already exists")
+        continue
+
     snvs_ht = import_cadd_table(f"gs://seqr-reference-data/GRCh{genome_version}/CADD/CADD_snvs.v1.6.tsv.gz", genome_version)
     indel_ht = import_cadd_table(f"gs://seqr-reference-data/GRCh{genome_version}/CADD/InDels_v1.6.tsv.gz", genome_version)
 
     ht = snvs_ht.union(indel_ht)
 
-    ht.naive_coalesce(10000).write(f"gs://seqr-reference-data/GRCh{genome_version}/CADD/CADD_snvs_and_indels.v1.6.ht", overwrite=True)
+    ht.naive_coalesce(10000).write(output_path, overwrite=True)
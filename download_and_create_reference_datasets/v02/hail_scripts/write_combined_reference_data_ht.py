@@ -4,7 +4,6 @@ import os
 import hail as hl
 
 from hail_scripts.reference_data.combine import join_hts
-from hail_scripts.reference_data.config import CONFIG
 
 VERSION = '2.0.4'
 OUTPUT_TEMPLATE = 'gs://seqr-reference-data/GRCh{genome_version}/' \
@@ -13,12 +12,11 @@ OUTPUT_TEMPLATE = 'gs://seqr-reference-data/GRCh{genome_version}/' \
 def run(args):
     hl._set_flags(no_whole_stage_codegen='1')  # hail 0.2.78 hits an error on the join, this flag gets around it
     joined_ht = join_hts(['cadd', 'mpc', 'eigen', 'dbnsfp', 'topmed', 'primate_ai', 'splice_ai', 'exac',
-              'gnomad_genomes', 'gnomad_exomes', 'geno2mp', 'gnomad_genome_coverage', 'gnomad_exome_coverage'],
-              VERSION,
-             args.build,)
+              'gnomad_genomes', 'gnomad_exomes'],
+              reference_genome=args.build)
     output_path = os.path.join(OUTPUT_TEMPLATE.format(genome_version=args.build, version=VERSION))
     print('Writing to %s' % output_path)
-    joined_ht.write(os.path.join(output_path))
+    joined_ht.write(output_path, stage_locally=True)
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ logger.setLevel(logging.INFO)
 
 p = ap.ArgumentParser()
 p.add_argument("-g", "--genome-version", help="Genome build: 37 or 38", choices=["37", "38"], default="37")
+p.add_argument("--print-count", help="Print the number of variants written to each table", action="store_true")
 args = p.parse_args()
 
 
@@ -43,10 +44,12 @@ def read_gnomad_subset(genome_version):
     return ht
 
 
-def write_out_ht(ht, output_path):
+def write_out_ht(ht, output_path, print_count=False):
     ht = ht.select()
-    print(ht.count())
     ht.write(output_path, overwrite=True)
+    if print_count:
+        # Counting the written table reads the stored row counts instead of re-running the filter.
+        print(hl.read_table(output_path).count())
 
 
 ht = read_gnomad_subset(args.genome_version)
@@ -54,9 +57,9 @@ ht.persist()
 
 coding_ht = ht.filter(
     hl.int(ht.main_transcript.major_consequence_rank) <= hl.int(CONSEQUENCE_TERM_RANK_LOOKUP.get('synonymous_variant')))
-write_out_ht(coding_ht, VALIDATION_KEYTABLE_PATHS['coding_{}'.format(args.genome_version)])
+write_out_ht(coding_ht, VALIDATION_KEYTABLE_PATHS['coding_{}'.format(args.genome_version)], args.print_count)
 
 
 noncoding_ht = ht.filter(
     hl.int(ht.main_transcript.major_consequence_rank) >= hl.int(CONSEQUENCE_TERM_RANK_LOOKUP.get('downstream_gene_variant')))
-write_out_ht(noncoding_ht, VALIDATION_KEYTABLE_PATHS['noncoding_{}'.format(args.genome_version)])
+write_out_ht(noncoding_ht, VALIDATION_KEYTABLE_PATHS['noncoding_{}'.format(args.genome_version)], args.print_count)
@@ -1,5 +1,8 @@
+import argparse
+import os
+
 import hail as hl
-from hail.expr import tint, tfloat, tstr
+from hail.expr import tint, tfloat32, tstr
 
 DBNSFP_INFO = {
     '2.9.3': {
@@ -55,13 +58,13 @@ DBNSFP_SCHEMA = {
         'phastCons100way_vertebrate_rankscore': tstr,
         'SiPhy_29way_pi': tstr,
         'SiPhy_29way_logOdds_rankscore': tstr,
-        'ESP6500_AA_AF': tfloat,
+        'ESP6500_AA_AF': tfloat32,
         # This space is intentional and in the file.
-        'ESP6500_EA_AF ': tfloat,
+        'ESP6500_EA_AF ': tfloat32,
         'ARIC5606_AA_AC': tint,
-        'ARIC5606_AA_AF': tfloat,
+        'ARIC5606_AA_AF': tfloat32,
         'ARIC5606_EA_AC': tint,
-        'ARIC5606_EA_AF': tfloat,
+        'ARIC5606_EA_AF': tfloat32,
     },
     '4.2': {
         '#chr': tstr,
@@ -136,12 +139,19 @@ def dbnsfp_to_ht(source_path, output_path, reference_genome='37', dbnsfp_version
     ht.write(output_path, overwrite=True)
     return ht
 
-def run():
+def run(force=False):
     for dbnsfp_version, config in DBNSFP_INFO.items():
+        if not force and hl.hadoop_exists(os.path.join(config["output_path"], "_SUCCESS")):
+            print(f"Skipping {config['output_path']}, it already exists")
+            continue
         ht = dbnsfp_to_ht(config["source_path"],
                           config["output_path"],
                           config['reference_genome'],
                           dbnsfp_version)
         ht.describe()
 
-run()
+p = argparse.ArgumentParser()
+p.add_argument("--force", help="Rewrite tables that have already been written successfully", action="store_true")
+args = p.parse_args()
+
+run(args.force)
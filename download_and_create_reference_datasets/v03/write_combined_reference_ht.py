@@ -47,14 +47,18 @@ def run(environment: str, genome_version: str, dataset: str | None):
             DATASETS,
             genome_version,
         )
+        # The updated table is read from the destination path, so it must be
+        # materialized elsewhere before the destination can be overwritten.
+        checkpoint_path = (
+            f"{GCS_PREFIXES[('dev', AccessControl.PUBLIC)]}/{uuid.uuid4()}.ht"
+        )
+        print(f'Checkpointing ht to {checkpoint_path}')
+        ht = ht.checkpoint(checkpoint_path, stage_locally=True)
     else:
         ht = join_hts(DATASETS, reference_genome=genome_version)
     ht.describe()
-    checkpoint_path = f"{GCS_PREFIXES[('dev', AccessControl.PUBLIC)]}/{uuid.uuid4()}.ht"
-    print(f'Checkpointing ht to {checkpoint_path}')
-    ht = ht.checkpoint(checkpoint_path, stage_locally=True)
     print(f'Uploading ht to {destination_path}')
-    write_ht(ht, destination_path)
+    write_ht(ht, destination_path, stage_locally=True)
 
 
 if __name__ == '__main__':
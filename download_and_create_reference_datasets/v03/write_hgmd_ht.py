@@ -18,9 +18,9 @@ def run(environment: str, genome_version: str):
     ).format(
         genome_version=genome_version,
     )
-    ht = get_ht(dataset, genome_version)
+    ht = get_ht(dataset, genome_version).repartition(PARTITIONS)
     print(f'Uploading ht to {destination_path}')
-    write_ht(ht, destination_path)
+    write_ht(ht, destination_path, stage_locally=True)
 
 
 if __name__ == '__main__':
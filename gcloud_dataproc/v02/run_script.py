@@ -7,29 +7,50 @@ import sys
 
 from kubernetes.shell_utils import simple_run as run
 
-unique_id = random.randint(10**5, 10**6 - 1)
-random_cluster_name = "without-vep-%s" % unique_id
 
-p = argparse.ArgumentParser()
-p.add_argument("-c", "--cluster", default=random_cluster_name)
-p.add_argument("script")
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
 
-args, unparsed_args = p.parse_known_args()
 
-cluster_name = args.cluster
-script = args.script
-script_args = " ".join(['"%s"' % arg for arg in unparsed_args])
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-os.chdir(os.path.join(os.path.dirname(__file__), "../.."))
+    unique_id = random.randint(10**5, 10**6 - 1)
+    random_cluster_name = "without-vep-%s" % unique_id
 
-run("./gcloud_dataproc/v02/create_cluster_without_VEP.py %(cluster_name)s 2 12" % locals())
+    # -h/--help is handled here so it can be passed through to the script when one is given.
+    p = argparse.ArgumentParser(add_help=False)
+    p.add_argument("-h", "--help", action="store_true", help="show this help message, or the script's if one is given, and exit")
+    p.add_argument("-c", "--cluster", default=random_cluster_name)
+    p.add_argument("script", nargs="?", help="path of the script to run, relative to the repo root")
 
-if "-h" in sys.argv or "--help" in sys.argv:
-    run("python %(script)s -h" % locals())
-    sys.exit(0)
+    args, unparsed_args = p.parse_known_args(argv)
 
+    if args.script is None:
+        if args.help:
+            p.print_help()
+            return
+        p.error("the following arguments are required: script")
 
-run((
-    "time ./gcloud_dataproc/submit.py "
-    "--cluster %(cluster_name)s "
-    "%(script)s %(script_args)s") % locals())
+    cluster_name = args.cluster
+    # Resolve paths against the repo root rather than changing the caller's working directory.
+    script = os.path.join(REPO_ROOT, args.script)
+    script_args = " ".join(['"%s"' % arg for arg in unparsed_args])
+
+    if args.help:
+        run("python %(script)s -h" % locals())
+        return
+
+    create_cluster_script = os.path.join(REPO_ROOT, "gcloud_dataproc/v02/create_cluster_without_VEP.py")
+    submit_script = os.path.join(REPO_ROOT, "gcloud_dataproc/submit.py")
+
+    run("%(create_cluster_script)s %(cluster_name)s 2 12" % locals())
+
+    run((
+        "time %(submit_script)s "
+        "--cluster %(cluster_name)s "
+        "%(script)s %(script_args)s") % locals())
+
+
+if __name__ == "__main__":
+    main()
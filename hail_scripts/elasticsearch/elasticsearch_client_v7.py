@@ -7,10 +7,10 @@ from pprint import pformat
 
 try:
     import elasticsearch
-except ImportError:
-    import os
-    os.system("pip install elasticsearch==7.9.1")
-    import elasticsearch
+except ImportError as e:
+    raise ImportError(
+        'The elasticsearch client is not installed. Run: pip install elasticsearch==7.9.1'
+    ) from e
 
 
 handlers = set(logging.root.handlers)
@@ -170,9 +170,10 @@ class HailElasticsearchClient(ElasticsearchClient):
 
             elasticsearch_schema = modified_elasticsearch_schema
 
-        # optionally delete the index before creating it
-        if delete_index_before_exporting and self.es.indices.exists(index=index_name):
-            self.es.indices.delete(index=index_name)
+        # optionally delete the index before creating it. A missing index is a 404, which is
+        # ignored so this is a single request rather than an exists check followed by a delete.
+        if delete_index_before_exporting:
+            self.es.indices.delete(index=index_name, ignore=[404])
 
         _meta = None
         if export_globals_to_index_meta:
@@ -22,6 +22,13 @@ def parse_version(ht: hl.Table, dataset: str, config: dict) -> hl.StringExpressi
     )
 
 
+def float64_to_float32(expression):
+    # Parse float64s into float32s to save space!
+    if expression.dtype == hl.tfloat64:
+        return hl.float32(expression)
+    return expression
+
+
 def get_select_fields(selects, base_ht):
     """
     Generic function that takes in a select config and base_ht and generates a
@@ -36,7 +43,9 @@ def get_select_fields(selects, base_ht):
     if selects is None:
         return select_fields
     if isinstance(selects, list):
-        select_fields = {selection: base_ht[selection] for selection in selects}
+        select_fields = {
+            selection: float64_to_float32(base_ht[selection]) for selection in selects
+        }
     elif isinstance(selects, dict):
         for key, val in selects.items():
             # Grab the field and continually select it from the hail table.
@@ -47,10 +56,7 @@ def get_select_fields(selects, base_ht):
                     expression = expression[attr[:-1]][base_ht.a_index - 1]
                 else:
                     expression = expression[attr]
-            # Parse float64s into float32s to save space!
-            if expression.dtype == hl.tfloat64:
-                expression = hl.float32(expression)
-            select_fields[key] = expression
+            select_fields[key] = float64_to_float32(expression)
     return select_fields
 
 
@@ -94,13 +100,22 @@ def get_ht(dataset: str, reference_genome: str):
         else hl.read_table(config['path'])
     )
     ht = ht.filter(config['filter'](ht)) if 'filter' in config else ht
+    select_fields = {
+        **get_select_fields(config.get('select'), ht),
+        **get_custom_select_fields(config.get('custom_select'), ht),
+    }
+    # Enum fields are mapped straight from the selected expressions (and replace
+    # them) so that the dataset struct is built in a single projection.
+    enum_selects = config.get('enum_select', {})
+    enum_select_fields = get_enum_select_fields(enum_selects, select_fields)
     ht = ht.select(
         **{
-            **get_select_fields(config.get('select'), ht),
-            **get_custom_select_fields(config.get('custom_select'), ht),
+            dataset: hl.struct(
+                **{k: v for k, v in select_fields.items() if k not in enum_selects},
+                **enum_select_fields,
+            ),
         },
     )
-    ht = ht.transmute(**get_enum_select_fields(config.get('enum_select'), ht))
     ht = ht.select_globals(
         **{
             f'{dataset}_globals': hl.struct(
@@ -117,7 +132,7 @@ def get_ht(dataset: str, reference_genome: str):
             ),
         },
     )
-    return ht.select(**{dataset: ht.row.drop(*ht.key)}).distinct()
+    return ht.distinct()
 
 
 def update_joined_ht_globals(
@@ -149,6 +164,6 @@ def update_existing_joined_hts(
     joined_ht = joined_ht.drop(dataset, f'{dataset}_globals')
     joined_ht = joined_ht.join(dataset_ht, 'outer')
     joined_ht = joined_ht.filter(
-        hl.any([~hl.is_missing(joined_ht[dataset]) for dataset in datasets]),
+        hl.any([hl.is_defined(joined_ht[dataset]) for dataset in datasets]),
     )
     return update_joined_ht_globals(joined_ht)
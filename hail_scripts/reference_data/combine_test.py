@@ -8,6 +8,7 @@ import pytz
 from hail_scripts.reference_data.combine import (
     get_enum_select_fields,
     get_ht,
+    get_select_fields,
     update_existing_joined_hts,
 )
 from hail_scripts.reference_data.config import dbnsfp_custom_select
@@ -151,6 +152,20 @@ class ReferenceDataCombineTest(unittest.TestCase):
             ],
         )
 
+    def test_get_select_fields_float32(self):
+        ht = hl.Table.parallelize(
+            [{'PHRED': 1.5, 'info': hl.Struct(score=0.25, n=1)}],
+            hl.tstruct(
+                PHRED=hl.tfloat64,
+                info=hl.tstruct(score=hl.tfloat64, n=hl.tint32),
+            ),
+        )
+        select_fields = get_select_fields(['PHRED'], ht)
+        self.assertEqual(select_fields['PHRED'].dtype, hl.tfloat32)
+        select_fields = get_select_fields({'score': 'info.score', 'n': 'info.n'}, ht)
+        self.assertEqual(select_fields['score'].dtype, hl.tfloat32)
+        self.assertEqual(select_fields['n'].dtype, hl.tint32)
+
     @mock.patch.dict(
         'hail_scripts.reference_data.combine.CONFIG',
         {
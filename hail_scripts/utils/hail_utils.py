@@ -100,12 +100,16 @@ def read_mt(mt_path: str):
     return hl.read_matrix_table(mt_path)
 
 
-def write_mt(mt_or_ht, output_path: str, overwrite: bool = True):
-    """Writes the given MatrixTable or Table to the given output path."""
+def write_mt(mt_or_ht, output_path: str, overwrite: bool = True, stage_locally: bool = False):
+    """Writes the given MatrixTable or Table to the given output path.
+
+    Pass stage_locally=True to write to local disk first and copy the result to the
+    output path in bulk, which is much faster than many small writes to GCS.
+    """
 
     logger.info(f"\n==> write out: {output_path}")
 
-    mt_or_ht.write(output_path, overwrite=overwrite)
+    mt_or_ht.write(output_path, overwrite=overwrite, stage_locally=stage_locally)
 
 write_ht = write_mt  # alias
 
@@ -1,6 +1,7 @@
 """
 Tasks for Hail.
 """
+import contextlib
 import json
 import logging
 import math
@@ -19,6 +20,55 @@ from luigi_pipeline.lib.global_config import GlobalConfig
 
 logger = logging.getLogger(__name__)
 
+# Contig names to recode when importing VCFs, by genome version.
+CONTIG_RECODING = {
+    '38': {f"{i}": f"chr{i}" for i in (list(range(1, 23)) + ['X', 'Y'])},
+    '37': {f"chr{i}": f"{i}" for i in (list(range(1, 23)) + ['X', 'Y'])},
+}
+
+
+# Maximum number of sample IDs to include when listing samples in an error message.
+MAX_SAMPLE_IDS_IN_MESSAGE = 100
+
+
+def format_sample_ids(sample_ids, total_count=None):
+    # Large callsets can have hundreds of thousands of samples, so only list the first few. Pass
+    # total_count when sample_ids are already only the first few of a longer list.
+    if total_count is None:
+        total_count = len(sample_ids)
+    if total_count <= MAX_SAMPLE_IDS_IN_MESSAGE:
+        return f'{sample_ids}'
+    return f'{sample_ids[:MAX_SAMPLE_IDS_IN_MESSAGE]} (first {MAX_SAMPLE_IDS_IN_MESSAGE} of {total_count})'
+
+
+def read_validation_ht_keys(path):
+    """
+    Collect the keys and row count of a (small) validation table in a single aggregation.
+
+    :param path: path to the validation Hail table
+    :return: tuple of (literal set expression of the table keys, number of rows)
+    """
+    ht = hl.read_table(path)
+    validation = ht.aggregate(hl.struct(keys=hl.agg.collect_as_set(ht.key), n=hl.agg.count()))
+    return hl.literal(validation.keys, dtype=hl.tset(ht.key.dtype)), validation.n
+
+
+@contextlib.contextmanager
+def hail_flags(**flags):
+    """
+    Set Hail flags for the duration of the block and restore their previous values afterwards,
+    even if the block raises. Flags are session wide, so this keeps one task's flags from leaking
+    into other tasks run by the same worker process.
+
+    :param flags: flag names and values to set, None unsets a flag
+    """
+    previous_flags = hl._get_flags(*flags)
+    hl._set_flags(**flags)
+    try:
+        yield
+    finally:
+        hl._set_flags(**previous_flags)
+
 
 class MatrixTableSampleSetError(Exception):
     def __init__(self, message, missing_samples):
@@ -31,6 +81,18 @@ def GCSorLocalTarget(filename):
     return target(filename)
 
 
+class PathParameter(luigi.Parameter):
+    """
+    Parameter holding a file or directory path. Trailing slashes are stripped so the same path
+    passed with and without one resolves to the same task id, and therefore the same output.
+    """
+
+    def normalize(self, x):
+        if isinstance(x, str):
+            return x.rstrip('/') or x
+        return x
+
+
 class VcfFile(luigi.Task):
     filename = luigi.Parameter()
     def output(self):
@@ -45,13 +107,19 @@ class HailMatrixTableTask(luigi.Task):
     """
 
     source_paths = luigi.Parameter(description='Path or list of paths of VCFs to be loaded.')
-    dest_path = luigi.Parameter(description='Path to write the matrix table.')
+    dest_path = PathParameter(description='Path to write the matrix table.')
     genome_version = luigi.Parameter(description='Reference Genome Version (37 or 38)')
     vep_runner = luigi.ChoiceParameter(choices=['VEP', 'DUMMY'], default='VEP', description='Choice of which vep runner'
                                                                                             'to annotate vep.')
     ignore_missing_samples_when_remapping = luigi.BoolParameter(default=False, description='Allow missing samples in the callset when remapping ids')
     ignore_missing_samples_when_subsetting = luigi.BoolParameter(default=False, description='Allow missing samples in the callset when subsetting to a selection of ids')
 
+    # Target compressed size of each partition when importing the source files.
+    SOURCE_PARTITION_BYTES = 128 * 1024 * 1024
+    # Fewest partitions to import into. The import partitioning carries through VEP and annotation,
+    # so small callsets still need enough partitions to keep the whole cluster busy.
+    MIN_SOURCE_PARTITIONS = 500
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -76,21 +144,31 @@ class HailMatrixTableTask(luigi.Task):
     def run(self):
         # Overwrite to do custom transformations.
         mt = self.import_vcf()
-        mt.write(self.output().path)
+        mt.write(self.output().path, stage_locally=True)
+
+    def source_min_partitions(self, paths=None):
+        """
+        Minimum number of partitions to import the source files into, based on their compressed size.
+        Large callsets get about one partition per SOURCE_PARTITION_BYTES, but never fewer than
+        MIN_SOURCE_PARTITIONS. Sizes are summed per file, as partitions never span files, so every
+        file (e.g. each per-chromosome shard) gets at least one partition of its own.
+
+        :param paths: paths or globs of the files to import, defaults to source_paths
+        :return: minimum number of partitions
+        """
+        file_partitions = sum(
+            max(1, math.ceil(f['size_bytes'] / self.SOURCE_PARTITION_BYTES))
+            for path in (paths or self.source_paths) for f in hl.hadoop_ls(path)
+        )
+        return max(self.MIN_SOURCE_PARTITIONS, file_partitions)
 
     def import_vcf(self):
         # Import the VCFs from inputs. Set min partitions so that local pipeline execution takes advantage of all CPUs.
-        recode = {}
-        if self.genome_version == "38":
-            recode = {f"{i}": f"chr{i}" for i in (list(range(1, 23)) + ['X', 'Y'])}
-        elif self.genome_version == "37":
-            recode = {f"chr{i}": f"{i}" for i in (list(range(1, 23)) + ['X', 'Y'])}
-
         return hl.import_vcf([vcf_file for vcf_file in self.source_paths],
                              reference_genome='GRCh' + self.genome_version,
                              skip_invalid_loci=True,
-                             contig_recoding=recode,
-                             force_bgz=True, min_partitions=500)
+                             contig_recoding=CONTIG_RECODING.get(self.genome_version, {}),
+                             force_bgz=True, min_partitions=self.source_min_partitions())
 
     @staticmethod
     def sample_type_stats(mt, genome_version, threshold=0.3):
@@ -108,11 +186,22 @@ class HailMatrixTableTask(luigi.Task):
             'noncoding': GlobalConfig().param_kwargs[f'validation_{genome_version}_noncoding_ht'],
             'coding': GlobalConfig().param_kwargs[f'validation_{genome_version}_coding_ht']
         }
-        for sample_type, ht_path in types_to_ht_path.items():
-            ht = hl.read_table(ht_path)
+        # The validation tables are small, so collect their keys once and broadcast them as literal
+        # sets rather than joining them against mt.
+        types_to_keys = {
+            sample_type: read_validation_ht_keys(ht_path) for sample_type, ht_path in types_to_ht_path.items()
+        }
+        # Annotate membership in every validation table so all matched counts come from one pass over mt.
+        mt = mt.select_rows(**{
+            sample_type: keys.contains(mt.row_key) for sample_type, (keys, _) in types_to_keys.items()
+        })
+        matched_counts = mt.aggregate_rows(hl.struct(**{
+            sample_type: hl.agg.count_where(mt[sample_type]) for sample_type in types_to_keys
+        }))
+        for sample_type, (_, total_count) in types_to_keys.items():
             stats[sample_type] = ht_stats = {
-                'matched_count': mt.semi_join_rows(ht).count_rows(),
-                'total_count': ht.count(),
+                'matched_count': matched_counts[sample_type],
+                'total_count': total_count,
 
             }
             ht_stats['match'] = (ht_stats['matched_count']/ht_stats['total_count']) >= threshold
@@ -137,26 +226,31 @@ class HailMatrixTableTask(luigi.Task):
         :return: MatrixTable subsetted to list of samples
         """
         subset_ht = hl.import_table(subset_path, key='s')
-        subset_count = subset_ht.count()
-        anti_join_ht = subset_ht.anti_join(mt.cols())
-        anti_join_ht_count = anti_join_ht.count()
+        # The subset is small, so filter the columns with a literal set rather than joining the
+        # callset columns against the subset table, and only collect the callset IDs it matches.
+        subset_samples = subset_ht.s.collect()
+        subset_count = len(subset_samples)
+        subset_sample_set = hl.literal(set(subset_samples), dtype=hl.tset(hl.tstr))
+        matched_samples = mt.aggregate_cols(hl.agg.filter(subset_sample_set.contains(mt.s), hl.agg.collect_as_set(mt.s)))
+        missing_samples = [s for s in subset_samples if s not in matched_samples]
+        callset_count = mt.count_cols()
 
-        if anti_join_ht_count != 0:
-            missing_samples = anti_join_ht.s.collect()
-            message = f'Only {subset_count - anti_join_ht_count} out of {subset_count} ' \
+        if len(missing_samples) != 0:
+            callset_samples = mt.s.take(MAX_SAMPLE_IDS_IN_MESSAGE)
+            message = f'Only {subset_count - len(missing_samples)} out of {subset_count} ' \
                       f'subsetting-table IDs matched IDs in the variant callset.\n' \
-                      f'IDs that aren\'t in the callset: {missing_samples}\n' \
-                      f'All callset sample IDs:{mt.s.collect()}'
-            if (subset_count > anti_join_ht_count) and self.ignore_missing_samples_when_subsetting:
+                      f'IDs that aren\'t in the callset: {format_sample_ids(missing_samples)}\n' \
+                      f'All callset sample IDs:{format_sample_ids(callset_samples, callset_count)}'
+            if (subset_count > len(missing_samples)) and self.ignore_missing_samples_when_subsetting:
                 logger.warning(message)
             else:
                 raise MatrixTableSampleSetError(message, missing_samples)
 
-        mt = mt.semi_join_cols(subset_ht)
+        mt = mt.filter_cols(subset_sample_set.contains(mt.s))
         mt = mt.filter_rows(hl.agg.any(self.relevant_variant_filter_fn(mt)))
 
         logger.info(f'Finished subsetting samples. Kept {subset_count} '
-                    f'out of {mt.count()} samples in vds')
+                    f'out of {callset_count} samples in vds')
         return mt
 
     def remap_sample_ids(self, mt, remap_path):
@@ -175,22 +269,25 @@ class HailMatrixTableTask(luigi.Task):
         if len(s_dups) > 0 or len(seqr_dups) > 0:
             raise ValueError(f"Duplicate s or seqr_id entries in remap file were found. Duplicate s:{s_dups}. Duplicate seqr_id:{seqr_dups}.")
 
-        missing_samples = remap_ht.anti_join(mt.cols()).collect()
+        # Collect only the callset IDs that are in the (small) remap file, in a single pass over the
+        # callset columns, and find the missing remap IDs locally.
+        remap_ids = hl.literal({r.s for r in collected_remap}, dtype=hl.tset(hl.tstr))
+        matched_samples = mt.aggregate_cols(hl.agg.filter(remap_ids.contains(mt.s), hl.agg.collect_as_set(mt.s)))
+        missing_samples = [r for r in collected_remap if r.s not in matched_samples]
         remap_count = len(collected_remap)
 
         if len(missing_samples) != 0:
-            message = f'Only {remap_ht.semi_join(mt.cols()).count()} out of {remap_count} ' \
+            callset_samples = mt.s.take(MAX_SAMPLE_IDS_IN_MESSAGE)
+            message = f'Only {remap_count - len(missing_samples)} out of {remap_count} ' \
                       'remap IDs matched IDs in the variant callset.\n' \
-                      f'IDs that aren\'t in the callset: {missing_samples}\n' \
-                      f'All callset sample IDs:{mt.s.collect()}'
+                      f'IDs that aren\'t in the callset: {format_sample_ids(missing_samples)}\n' \
+                      f'All callset sample IDs:{format_sample_ids(callset_samples, mt.count_cols())}'
             if self.ignore_missing_samples_when_remapping:
                 logger.warning(message)
             else:
                 raise MatrixTableSampleSetError(message, missing_samples)
 
-        mt = mt.annotate_cols(**remap_ht[mt.s])
-        remap_expr = hl.cond(hl.is_missing(mt.seqr_id), mt.s, mt.seqr_id)
-        mt = mt.annotate_cols(seqr_id=remap_expr, vcf_id=mt.s)
+        mt = mt.annotate_cols(seqr_id=hl.coalesce(remap_ht[mt.s].seqr_id, mt.s), vcf_id=mt.s)
         mt = mt.key_cols_by(s=mt.seqr_id)
         logger.info(f'Remapped {remap_count} sample ids...')
         return mt
@@ -273,5 +370,6 @@ class HailElasticSearchTask(luigi.Task):
     def _mt_num_shards(self, mt):
         # The greater of the user specified min shards and calculated based on the variants and samples
         denominator = 1.4*10**9
-        calculated_num_shards = math.ceil((mt.count_rows() * mt.count_cols())/denominator)
+        n_rows, n_cols = mt.count()
+        calculated_num_shards = math.ceil((n_rows * n_cols)/denominator)
         return max(self.es_index_min_num_shards, calculated_num_shards)
@@ -97,12 +97,12 @@ class SeqrMitoGenotypesSchema(SeqrGenotypesSchema):
         # Convert the mt genotype entries into num_alt, gq, hl, mito_cn, contamination, dp, and sample_id.
         is_called = hl.is_defined(self.mt.GT)
         return {
-            'num_alt': hl.cond(is_called, hl.cond(self.mt.HL>=0.95, 2, hl.cond(self.mt.HL>=0.01, 1, 0)), -1),
-            'gq': hl.cond(is_called, self.mt.MQ, 0),
-            'hl': hl.cond(is_called, self.mt.HL, 0),
+            'num_alt': hl.if_else(is_called, hl.if_else(self.mt.HL>=0.95, 2, hl.if_else(self.mt.HL>=0.01, 1, 0)), -1),
+            'gq': hl.if_else(is_called, self.mt.MQ, 0),
+            'hl': hl.if_else(is_called, self.mt.HL, 0),
             'mito_cn': hl.int(self.mt.mito_cn),
             'contamination': self.mt.contamination,
-            'dp': hl.cond(is_called, hl.int(hl.min(self.mt.DP, 32000)), hl.missing(hl.tfloat)),
+            'dp': hl.if_else(is_called, hl.int(hl.min(self.mt.DP, 32000)), hl.missing(hl.tfloat)),
             'sample_id': self.mt.s
         }
 
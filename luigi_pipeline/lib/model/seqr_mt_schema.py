@@ -42,8 +42,9 @@ class BaseSeqrSchema(BaseVariantSchema):
         self._clinvar_data = clinvar_data
         self._hgmd_data = hgmd_data
 
-        # See _selected_ref_data
+        # See _selected_ref_data and _selected_interval_ref_data
         self._selected_ref_data_cache = None
+        self._selected_interval_ref_data_cache = None
 
         super().__init__(*args, **kwargs)
 
@@ -52,6 +53,7 @@ class BaseSeqrSchema(BaseVariantSchema):
         # set this to None, and the @property _selected_ref_data
         # can populate it if it gets used after each MT update.
         self._selected_ref_data_cache = None
+        self._selected_interval_ref_data_cache = None
 
     @property
     def _selected_ref_data(self):
@@ -67,6 +69,20 @@ class BaseSeqrSchema(BaseVariantSchema):
             self._selected_ref_data_cache = self._ref_data[self.mt.row_key]
         return self._selected_ref_data_cache
 
+    @property
+    def _selected_interval_ref_data(self):
+        """
+        Same as _selected_ref_data, but for the interval-keyed reference data,
+        so that all interval annotations share a single interval join.
+
+        Returns: self._interval_ref_data.index(self.mt.locus, all_matches=True)
+        """
+        if self._selected_interval_ref_data_cache is None:
+            self._selected_interval_ref_data_cache = self._interval_ref_data.index(
+                self.mt.locus, all_matches=True
+            )
+        return self._selected_interval_ref_data_cache
+
     @row_annotation()
     def vep(self):
         return self.mt.vep
@@ -141,9 +157,11 @@ class BaseSeqrSchema(BaseVariantSchema):
 
     @row_annotation()
     def clinvar(self):
-        return hl.struct(**{'allele_id': self._clinvar_data[self.mt.row_key].info.ALLELEID,
-                            'clinical_significance': hl.delimit(self._clinvar_data[self.mt.row_key].info.CLNSIG),
-                            'gold_stars': self._clinvar_data[self.mt.row_key].gold_stars})
+        # Look up the row once so all fields are pulled from a single join.
+        clinvar = self._clinvar_data[self.mt.row_key]
+        return hl.struct(**{'allele_id': clinvar.info.ALLELEID,
+                            'clinical_significance': hl.delimit(clinvar.info.CLNSIG),
+                            'gold_stars': clinvar.gold_stars})
 
     @row_annotation()
     def dbnsfp(self):
@@ -198,8 +216,9 @@ class SeqrSchema(BaseSeqrSchema):
     def hgmd(self):
         if self._hgmd_data is None:
             raise RowAnnotationOmit
-        return hl.struct(**{'accession': self._hgmd_data[self.mt.row_key].rsid,
-                            'class': self._hgmd_data[self.mt.row_key].info.CLASS})
+        hgmd = self._hgmd_data[self.mt.row_key]
+        return hl.struct(**{'accession': hgmd.rsid,
+                            'class': hgmd.info.CLASS})
 
     @row_annotation()
     def gnomad_non_coding_constraint(self):
@@ -207,9 +226,7 @@ class SeqrSchema(BaseSeqrSchema):
             raise RowAnnotationOmit
         return hl.struct(
             **{
-                "z_score": self._interval_ref_data.index(
-                    self.mt.locus, all_matches=True
-                )
+                "z_score": self._selected_interval_ref_data
                 .filter(
                     lambda x: hl.is_defined(x.gnomad_non_coding_constraint["z_score"])
                 )
@@ -223,9 +240,9 @@ class SeqrSchema(BaseSeqrSchema):
             raise RowAnnotationOmit
         return hl.struct(
             **{
-                "region_type": self._interval_ref_data.index(
-                    self.mt.locus, all_matches=True
-                ).flatmap(lambda x: x.screen["region_type"])
+                "region_type": self._selected_interval_ref_data.flatmap(
+                    lambda x: x.screen["region_type"]
+                )
             }
         )
 
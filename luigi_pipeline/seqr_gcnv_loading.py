@@ -54,7 +54,9 @@ class SeqrGCNVVariantMTTask(SeqrVCFToVariantMTTask):
         return mt
 
     def import_dataset(self):
-        ht = hl.import_table(self.source_paths[0], types=FIELD_TYPES, min_partitions=500)
+        # Only the first source path is imported, so only size that file. The partition floor matches the VCF import.
+        ht = hl.import_table(self.source_paths[0], types=FIELD_TYPES,
+                             min_partitions=self.source_min_partitions(self.source_paths[:1]))
         mt = ht.to_matrix_table(
             row_key=['variant_name', 'svtype'], col_key=['sample_fix'],
             # Analagous to CORE_COLUMNS = [CHR_COL, SC_COL, SF_COL, CALL_COL, IN_SILICO_COL] in the old implementation
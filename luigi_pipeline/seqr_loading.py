@@ -12,6 +12,8 @@ from luigi_pipeline.lib.hail_tasks import (
     HailElasticSearchTask,
     HailMatrixTableTask,
     MatrixTableSampleSetError,
+    PathParameter,
+    hail_flags,
 )
 from luigi_pipeline.lib.model.seqr_mt_schema import (
     SeqrGenotypesSchema,
@@ -22,7 +24,7 @@ from luigi_pipeline.lib.model.seqr_mt_schema import (
 logger = logging.getLogger(__name__)
 GRCh37_STANDARD_CONTIGS = {'1','10','11','12','13','14','15','16','17','18','19','2','20','21','22','3','4','5','6','7','8','9','X','Y', 'MT'}
 GRCh38_STANDARD_CONTIGS = {'chr1','chr10','chr11','chr12','chr13','chr14','chr15','chr16','chr17','chr18','chr19','chr2','chr20','chr21','chr22','chr3','chr4','chr5','chr6','chr7','chr8','chr9','chrX','chrY', 'chrM'}
-OPTIONAL_CHROMOSOMES = ['MT', 'chrM', 'Y', 'chrY']
+OPTIONAL_CHROMOSOMES = {'MT', 'chrM', 'Y', 'chrY'}
 VARIANT_THRESHOLD = 100
 CONST_GRCh37 = '37'
 CONST_GRCh38 = '38'
@@ -64,28 +66,29 @@ class SeqrVCFToMTTask(HailMatrixTableTask):
     hail_temp_dir = luigi.OptionalParameter(default=None, description="Networked temporary directory used by hail for temporary file storage. Must be a network-visible file path.")
     RUN_VEP = True
     SCHEMA_CLASS = SeqrVariantsAndGenotypesSchema
+    # Parameters holding paths that must exist when they are set.
+    OPTIONAL_PATH_PARAMS = ['interval_ref_ht_path', 'hgmd_ht_path', 'remap_path', 'subset_path',
+                            'vep_config_json_path', 'grch38_to_grch37_ref_chain', 'hail_temp_dir']
 
     def run(self):
         if self.hail_temp_dir:
             hl.init(tmp_dir=self.hail_temp_dir) # Need to use the GCP bucket as temp storage for very large callset joins
         
         # first validate paths
-        for source_path in self.source_paths:
-            if '*' in source_path:
-                continue
-            check_if_path_exists(source_path, "source_path")
+        paths_to_check = [(source_path, "source_path") for source_path in self.source_paths if '*' not in source_path]
         if self.dataset_type in set(['VARIANTS', 'MITO']):
-            check_if_path_exists(self.reference_ht_path, "reference_ht_path")
-            check_if_path_exists(self.clinvar_ht_path, "clinvar_ht_path")
-        if self.interval_ref_ht_path: check_if_path_exists(self.interval_ref_ht_path, "interval_ref_ht_path")
-        if self.hgmd_ht_path: check_if_path_exists(self.hgmd_ht_path, "hgmd_ht_path")
-        if self.remap_path: check_if_path_exists(self.remap_path, "remap_path")
-        if self.subset_path: check_if_path_exists(self.subset_path, "subset_path")
-        if self.vep_config_json_path: check_if_path_exists(self.vep_config_json_path, "vep_config_json_path")
-        if self.grch38_to_grch37_ref_chain: check_if_path_exists(self.grch38_to_grch37_ref_chain, "grch38_to_grch37_ref_chain")
-        if self.hail_temp_dir: check_if_path_exists(self.hail_temp_dir, "hail_temp_dir")
-
-        self.read_input_write_mt()
+            paths_to_check.append((self.reference_ht_path, "reference_ht_path"))
+            paths_to_check.append((self.clinvar_ht_path, "clinvar_ht_path"))
+        for param_name in self.OPTIONAL_PATH_PARAMS:
+            path = getattr(self, param_name)
+            if path:
+                paths_to_check.append((path, param_name))
+        for path, label in paths_to_check:
+            check_if_path_exists(path, label)
+
+        # Interval ref data join causes shuffle death, the new shuffle prevents it.
+        with hail_flags(use_new_shuffle='1'):
+            self.read_input_write_mt()
 
     def get_schema_class_kwargs(self):
         ref = hl.read_table(self.reference_ht_path)
@@ -106,28 +109,42 @@ class SeqrVCFToMTTask(HailMatrixTableTask):
         return mt
 
     def import_dataset(self):
-        logger.info("Args:")
-        pprint.pprint(self.__dict__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Args:\n%s", pprint.pformat(self.__dict__))
 
         return self.import_vcf()
 
     def read_input_write_mt(self):
-        hl._set_flags(use_new_shuffle='1') # Interval ref data join causes shuffle death, this prevents it
-
         mt = self.import_dataset()
-        if hasattr(mt, 'PL'):
-            mt = mt.drop('PL')
-        if hasattr(mt, 'AF'):
-            mt = mt.drop('AF')
-        mt = self.split_multi_hts(mt)
+        # Drop unused fields together so only a single projection is added to the plan.
+        unused_fields = [field for field in ('PL', 'AF') if hasattr(mt, field)]
+        if unused_fields:
+            mt = mt.drop(*unused_fields)
+        # Filter to the standard contigs before splitting so non-standard contigs aren't split only to be dropped.
         standard_contigs = GRCh38_STANDARD_CONTIGS if self.genome_version == '38' else GRCh37_STANDARD_CONTIGS
         mt = mt.filter_rows(
-            hl.set(standard_contigs).contains(
+            hl.literal(standard_contigs, dtype=hl.tset(hl.tstr)).contains(
                 mt.locus.contig,
             ),
         )
-        if not self.dont_validate:
+        mt = self.split_multi_hts(mt)
+        if self.dont_validate:
+            self.annotate_and_write_mt(mt)
+            return
+
+        # Validation runs several aggregations over the dataset, checkpoint so the source VCFs are
+        # only decoded once rather than once per aggregation. The checkpoint is a full copy of the
+        # callset, so delete it once the output MT is written, or the task fails.
+        checkpoint_path = hl.utils.new_temp_file('validate', 'mt')
+        try:
+            mt = mt.checkpoint(checkpoint_path)
             self.validate_mt(mt, self.genome_version, self.sample_type)
+            self.annotate_and_write_mt(mt)
+        finally:
+            if hl.hadoop_exists(checkpoint_path):
+                hl.current_backend().fs.rmtree(checkpoint_path)
+
+    def annotate_and_write_mt(self, mt):
         if self.remap_path:
             mt = self.remap_sample_ids(mt, self.remap_path)
         if self.subset_path:
@@ -143,7 +160,7 @@ class SeqrVCFToMTTask(HailMatrixTableTask):
         mt = self.SCHEMA_CLASS(mt, **kwargs).annotate_all(overwrite=True).select_annotated_mt()
         mt = self.annotate_globals(mt, kwargs.get("clinvar_data"))
 
-        mt.describe()
+        mt.describe(handler=logger.debug)
         mt.write(self.output().path, stage_locally=True, overwrite=True)
 
     def split_multi_hts(self, mt):
@@ -165,10 +182,8 @@ class SeqrVCFToMTTask(HailMatrixTableTask):
 
         # check chromosomes that are not in the VCF  
         row_dict = mt.aggregate_rows(hl.agg.counter(mt.locus.contig))
-        contigs_set = set(row_dict.keys())
 
-        all_missing_contigs = standard_contigs - contigs_set
-        missing_contigs_without_optional = [contig for contig in all_missing_contigs if contig not in OPTIONAL_CHROMOSOMES]
+        missing_contigs_without_optional = sorted(standard_contigs - row_dict.keys() - OPTIONAL_CHROMOSOMES)
 
         if missing_contigs_without_optional:
             check_result_dict['Missing contig(s)'] = missing_contigs_without_optional
@@ -248,7 +263,7 @@ class SeqrVCFToMTTask(HailMatrixTableTask):
 
 class SeqrMTToESTask(HailElasticSearchTask):
     source_paths = luigi.Parameter(default="[]", description='Path or list of paths of VCFs to be loaded.')
-    dest_path = luigi.Parameter(description='Path to write the matrix table.')
+    dest_path = PathParameter(description='Path to write the matrix table.')
     genome_version = luigi.Parameter(description='Reference Genome Version (37 or 38)')
     vep_runner = luigi.ChoiceParameter(choices=['VEP', 'DUMMY'], default='VEP', description='Choice of which vep runner to annotate vep.')
 
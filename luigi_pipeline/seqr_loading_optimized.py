@@ -47,7 +47,7 @@ class BaseVCFToGenotypesMTTask(HailMatrixTableTask):
         kwargs = self.get_schema_class_kwargs()
         mt = self.GenotypesSchema(mt, **kwargs).annotate_all(overwrite=True).select_annotated_mt()
 
-        mt.describe()
+        mt.describe(handler=logger.debug)
         mt.write(self.output().path, stage_locally=True, overwrite=True)
 
 
@@ -54,6 +54,16 @@ class TestHailTasks(unittest.TestCase):
         mt = task.import_vcf()
         self.assertEqual(mt.count(), (30, 16))
 
+    def test_hail_matrix_table_dest_path_trailing_slash(self):
+        task = self._hail_matrix_table_task()
+        slash_task = HailMatrixTableTask(
+            source_paths=[TEST_DATA_MT_1KG],
+            dest_path=f'{self._temp_dest_path()}/',
+            genome_version='37',
+        )
+        self.assertEqual(slash_task.dest_path, task.dest_path)
+        self.assertEqual(slash_task.task_id, task.task_id)
+
     def test_hail_matrix_table_run(self):
         task = self._hail_matrix_table_task()
         task.run()
@@ -10,9 +10,10 @@ TEST_DATA_MT_1KG = 'tests/data/1kg_30variants.vcf.bgz'
 
 @patch('luigi_pipeline.seqr_loading.SeqrVCFToMTTask.contig_check', return_value={})
 class TestSeqrLoadingTasks(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary directory
-        self.test_mt = hl.import_vcf(TEST_DATA_MT_1KG)
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the MT, so import the VCF once for the whole class.
+        cls.test_mt = hl.import_vcf(TEST_DATA_MT_1KG)
 
     def _sample_type_stats_return_value(  # noqa: PLR0913
         self,